@@ -14,21 +14,13 @@ from file_organizer.logger import setup_logger
 class CustomFileCategorizer(FileCategorizer):
     """Extended categorizer with custom categories."""
     
-    def __init__(self):
-        """Initialize with custom categories."""
-        # Add custom categories
-        self.CATEGORIES = {
-            **FileCategorizer.CATEGORIES,  # Include default categories
-            "Code": {"py", "js", "java", "cpp", "c", "h", "cs", "go", "rs"},
-            "Data": {"csv", "json", "xml", "yaml", "yml", "sql"},
-            "Ebooks": {"epub", "mobi", "azw", "azw3"},
-        }
-        
-        # Rebuild the extension mapping
-        self._extension_to_category = {}
-        for category, extensions in self.CATEGORIES.items():
-            for ext in extensions:
-                self._extension_to_category[ext.lower()] = category
+    # Add custom categories (the extension mapping is rebuilt automatically)
+    CATEGORIES = {
+        **FileCategorizer.CATEGORIES,  # Include default categories
+        "Code": {"py", "js", "java", "cpp", "c", "h", "cs", "go", "rs"},
+        "Data": {"csv", "json", "xml", "yaml", "yml", "sql"},
+        "Ebooks": {"epub", "mobi", "azw", "azw3"},
+    }
 
 
 def main():
@@ -36,6 +36,9 @@ setup(
             "pytest-cov>=4.0.0",
             "hypothesis>=6.0.0",
         ],
+        "inotify": [
+            "inotify_simple>=1.3.0",
+        ],
     },
     entry_points={
         "console_scripts": [
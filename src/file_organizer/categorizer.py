@@ -1,27 +1,50 @@
 """File categorization based on extension."""
+import sys
 from pathlib import Path
-from typing import Dict, Set
+from typing import Dict, FrozenSet
 
 
 class FileCategorizer:
     """Categorizes files based on their extension."""
     
-    # Extension to category mappings
-    CATEGORIES: Dict[str, Set[str]] = {
-        "Pictures": {"jpg", "jpeg", "png", "gif", "bmp", "svg", "webp"},
-        "Documents": {"pdf", "doc", "docx", "txt", "rtf", "odt", "xls", "xlsx", "ppt", "pptx"},
-        "Videos": {"mp4", "avi", "mkv", "mov", "wmv", "flv", "webm"},
-        "Audio": {"mp3", "wav", "flac", "aac", "ogg", "m4a"},
-        "Archives": {"zip", "rar", "tar", "gz", "7z", "bz2"},
+    # Extension to category mappings (immutable; subclasses replace the dict wholesale)
+    CATEGORIES: Dict[str, FrozenSet[str]] = {
+        "Pictures": frozenset({"jpg", "jpeg", "png", "gif", "bmp", "svg", "webp"}),
+        "Documents": frozenset({"pdf", "doc", "docx", "txt", "rtf", "odt", "xls", "xlsx", "ppt", "pptx"}),
+        "Videos": frozenset({"mp4", "avi", "mkv", "mov", "wmv", "flv", "webm"}),
+        "Audio": frozenset({"mp3", "wav", "flac", "aac", "ogg", "m4a"}),
+        "Archives": frozenset({"zip", "rar", "tar", "gz", "7z", "bz2"}),
     }
     
+    # Reverse mapping (extension -> category), built once per class
+    _EXT_MAP: Dict[str, str] = {}
+    
+    def __init_subclass__(cls, **kwargs):
+        """Rebuild the reverse mapping for subclasses that define their own CATEGORIES."""
+        super().__init_subclass__(**kwargs)
+        cls._EXT_MAP = cls._build_map()
+    
+    @classmethod
+    def _build_map(cls) -> Dict[str, str]:
+        """
+        Build the extension to category lookup table from CATEGORIES.
+        
+        Keys are interned so lookups with equal interned strings can match
+        by identity before falling back to a full string comparison.
+        
+        Returns:
+            Dictionary mapping lowercase extensions to category names
+        """
+        return {
+            sys.intern(ext.lower()): category
+            for category, extensions in cls.CATEGORIES.items()
+            for ext in extensions
+        }
+    
     def __init__(self):
         """Initialize the file categorizer."""
-        # Create reverse mapping for faster lookup
-        self._extension_to_category: Dict[str, str] = {}
-        for category, extensions in self.CATEGORIES.items():
-            for ext in extensions:
-                self._extension_to_category[ext.lower()] = category
+        # Share the class-level mapping, so creating a categorizer is O(1)
+        self._extension_to_category: Dict[str, str] = type(self)._EXT_MAP
     
     def get_category(self, file_path: Path) -> str:
         """
@@ -33,12 +56,28 @@ class FileCategorizer:
         Returns:
             Category name as string (Pictures, Documents, Videos, Audio, Archives, or Others)
         """
-        # Get the file extension without the dot and normalize to lowercase
-        extension = file_path.suffix.lstrip('.').lower()
+        return self.get_category_from_name(file_path.name)
+    
+    def get_category_from_name(self, name: str) -> str:
+        """
+        Determines the category for a raw filename string.
+        
+        Avoids constructing a Path on the hot path (e.g., DirEntry.name).
         
-        # Handle files without extensions
-        if not extension:
+        Args:
+            name: Filename including its extension
+            
+        Returns:
+            Category name as string (Pictures, Documents, Videos, Audio, Archives, or Others)
+        """
+        # Get the file extension without the dot; a leading dot (e.g., ".bashrc")
+        # marks a hidden file rather than an extension, matching Path.suffix
+        i = name.rfind('.')
+        if i <= 0:
             return "Others"
         
         # Look up the category, default to "Others" if not found
-        return self._extension_to_category.get(extension, "Others")
+        return self._extension_to_category.get(name[i + 1:].lower(), "Others")
+
+
+FileCategorizer._EXT_MAP = FileCategorizer._build_map()
@@ -1,5 +1,6 @@
 """Command-line interface for File Organization Bot."""
 import sys
+import signal
 import argparse
 from pathlib import Path
 from typing import Optional
@@ -31,6 +32,28 @@ def get_default_downloads_path() -> Path:
     return downloads_path
 
 
+def positive_int(value: str) -> int:
+    """
+    Argparse type for strictly positive integers.
+    
+    Args:
+        value: Raw command-line value
+        
+    Returns:
+        Parsed integer
+        
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a positive integer
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def run_watch_mode(args: argparse.Namespace) -> int:
     """
     Run the bot in watch mode (real-time monitoring).
@@ -61,12 +84,14 @@ def run_watch_mode(args: argparse.Namespace) -> int:
         logger.info("=" * 60)
         logger.info("File Organization Bot - Watch Mode")
         logger.info("=" * 60)
-        logger.info(f"Monitoring: {watch_path}")
+        logger.info("Monitoring: %s", watch_path)
         
         # Initialize components
         categorizer = FileCategorizer()
         file_mover = FileMover(logger)
-        organizer = FileOrganizer(watch_path, categorizer, file_mover, logger)
+        organizer = FileOrganizer(
+            watch_path, categorizer, file_mover, logger, max_workers=args.max_concurrency
+        )
         watcher = FileWatcher(watch_path, organizer, logger)
         
         # Start watching
@@ -94,7 +119,7 @@ def run_organize_mode(args: argparse.Namespace) -> int:
     try:
         # Setup logger
         log_file = Path(args.log_file) if args.log_file else None
-        logger = setup_logger(log_file=log_file)
+        logger = setup_logger(log_file=log_file, buffered=True)
         
         # Get organize path
         organize_path = Path(args.path) if args.path else get_default_downloads_path()
@@ -111,18 +136,20 @@ def run_organize_mode(args: argparse.Namespace) -> int:
         logger.info("=" * 60)
         logger.info("File Organization Bot - Organize Mode")
         logger.info("=" * 60)
-        logger.info(f"Organizing: {organize_path}")
+        logger.info("Organizing: %s", organize_path)
         
         # Initialize components
         categorizer = FileCategorizer()
         file_mover = FileMover(logger)
-        organizer = FileOrganizer(organize_path, categorizer, file_mover, logger)
+        organizer = FileOrganizer(
+            organize_path, categorizer, file_mover, logger, max_workers=args.max_concurrency
+        )
         
         # Organize all files
         count = organizer.organize_all()
         
         logger.info("=" * 60)
-        logger.info(f"Successfully organized {count} files")
+        logger.info("Successfully organized %d files", count)
         logger.info("=" * 60)
         
         return 0
@@ -132,6 +159,24 @@ def run_organize_mode(args: argparse.Namespace) -> int:
         return 1
 
 
+# Command name -> handler
+COMMANDS = {
+    'watch': run_watch_mode,
+    'organize': run_organize_mode,
+}
+
+
+def _exit_on_signal(signum, frame) -> None:
+    """
+    Turn a termination signal into a normal exit so atexit handlers run.
+    
+    Args:
+        signum: Signal number
+        frame: Current stack frame (unused)
+    """
+    sys.exit(128 + signum)
+
+
 def main():
     """
     Main entry point for the CLI.
@@ -154,55 +199,48 @@ Examples:
   
   # Enable file logging
   file-organizer watch --log-file organizer.log
+  
+  # Move files with 4 worker threads
+  file-organizer organize --max-concurrency 4
         """
     )
     
-    # Create subparsers for commands
-    subparsers = parser.add_subparsers(dest='command', help='Command to execute')
-    
-    # Watch command
-    watch_parser = subparsers.add_parser(
-        'watch',
-        help='Monitor directory in real-time and organize new files automatically'
+    # Single parser: the command is a positional choice and all options are shared
+    parser.add_argument(
+        'command',
+        nargs='?',
+        choices=list(COMMANDS),
+        help="'watch' to monitor directory in real-time and organize new files automatically, "
+             "'organize' to organize all existing files in directory once"
     )
-    watch_parser.add_argument(
+    parser.add_argument(
         '--path',
         type=str,
-        help='Directory to monitor (default: ~/Downloads)'
+        help='Directory to monitor or organize (default: ~/Downloads)'
     )
-    watch_parser.add_argument(
+    parser.add_argument(
         '--log-file',
         type=str,
         help='Enable file logging to specified path'
     )
-    
-    # Organize command
-    organize_parser = subparsers.add_parser(
-        'organize',
-        help='Organize all existing files in directory once'
-    )
-    organize_parser.add_argument(
-        '--path',
-        type=str,
-        help='Directory to organize (default: ~/Downloads)'
-    )
-    organize_parser.add_argument(
-        '--log-file',
-        type=str,
-        help='Enable file logging to specified path'
+    parser.add_argument(
+        '--max-concurrency',
+        type=positive_int,
+        default=1,
+        help='Number of files to move in parallel (default: 1)'
     )
     
     # Parse arguments
     args = parser.parse_args()
     
     # Execute appropriate command
-    if args.command == 'watch':
-        sys.exit(run_watch_mode(args))
-    elif args.command == 'organize':
-        sys.exit(run_organize_mode(args))
-    else:
+    if args.command is None:
         parser.print_help()
         sys.exit(1)
+    
+    # Exit normally on SIGTERM (e.g. systemd stop) so buffered logs are written
+    signal.signal(signal.SIGTERM, _exit_on_signal)
+    sys.exit(COMMANDS[args.command](args))
 
 
 if __name__ == '__main__':
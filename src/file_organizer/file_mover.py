@@ -1,9 +1,37 @@
 """File moving operations with duplicate handling."""
+import errno
+import os
 import shutil
 import logging
+import threading
+import time
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional, Set, Tuple, Union
+
+
+# Three-letter month folder names, independent of the current locale
+_MONTHS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+
+@lru_cache(maxsize=4096)
+def _ts_to_ym(ts_sec: int) -> Tuple[str, str]:
+    """
+    Convert a timestamp to its year and three-letter month folder names.
+    
+    Files from bulk downloads or extracted archives often share the same
+    mtime second, so the conversion is memoized.
+    
+    Args:
+        ts_sec: Timestamp in whole seconds
+        
+    Returns:
+        Tuple of (year, month), e.g. ("2025", "Dec")
+    """
+    local_time = time.localtime(ts_sec)
+    return str(local_time.tm_year), _MONTHS[local_time.tm_mon - 1]
 
 
 class FileMover:
@@ -17,27 +45,118 @@ class FileMover:
             logger: Logger instance for operation tracking
         """
         self.logger = logger or logging.getLogger(__name__)
+        
+        # Destination directories already created by this mover
+        self._known_dirs: Set[str] = set()
+        
+        # Snapshot of filenames per destination directory, used to pick
+        # duplicate suffixes without probing name(1), name(2), ... one by one
+        self._dir_contents: Dict[str, Set[str]] = {}
+        
+        # Per-destination locks so concurrent moves can't claim the same duplicate name
+        self._dir_locks: Dict[str, threading.Lock] = defaultdict(threading.Lock)
+        self._dir_locks_guard = threading.Lock()
+    
+    def _get_dir_lock(self, directory: str) -> threading.Lock:
+        """
+        Get the lock guarding duplicate resolution in a destination directory.
+        
+        Args:
+            directory: Destination directory
+            
+        Returns:
+            Lock shared by all moves into that directory
+        """
+        with self._dir_locks_guard:
+            return self._dir_locks[directory]
+    
+    def get_destination_parts(
+        self, category: str, file_date: Union[datetime, float]
+    ) -> Tuple[str, str, str]:
+        """
+        Get the folder names a file belongs in, without touching the disk.
+        
+        Args:
+            category: File category (Pictures, Documents, etc.)
+            file_date: Date (or modification timestamp) to use for folder structure
+            
+        Returns:
+            Tuple of (category, year, month), e.g. ("Pictures", "2025", "Dec")
+        """
+        # Format: Category/YYYY/MMM (e.g., Pictures/2025/Dec)
+        if isinstance(file_date, datetime):
+            year = str(file_date.year)
+            month = _MONTHS[file_date.month - 1]  # Three-letter month abbreviation
+        else:
+            year, month = _ts_to_ym(int(file_date))
+        return category, year, month
     
-    def create_destination_path(self, base_dir: Path, category: str, file_date: datetime) -> Path:
+    def prepare_destination(
+        self, base_dir: str, category: str, file_date: Union[datetime, float]
+    ) -> str:
+        """
+        Create a destination folder and take a fresh snapshot of its contents.
+        
+        Called once per folder before a batch of moves into it, so duplicate
+        names in the batch are resolved against a single directory listing.
+        
+        Args:
+            base_dir: Base directory for organization
+            category: File category (Pictures, Documents, etc.)
+            file_date: Date (or modification timestamp) to use for folder structure
+            
+        Returns:
+            Created directory path
+        """
+        destination_dir = self._create_destination_dir(base_dir, category, file_date)
+        try:
+            self._get_dir_contents(destination_dir, refresh=True)
+        except FileNotFoundError:
+            # Created earlier by this mover but deleted since: make it again
+            self._known_dirs.discard(destination_dir)
+            self._create_destination_dir(base_dir, category, file_date)
+            self._get_dir_contents(destination_dir, refresh=True)
+        return destination_dir
+    
+    def create_destination_path(
+        self, base_dir: Path, category: str, file_date: Union[datetime, float]
+    ) -> Path:
         """
         Creates the destination directory structure: Category/YYYY/MMM
         
         Args:
             base_dir: Base directory for organization
             category: File category (Pictures, Documents, etc.)
-            file_date: Date to use for folder structure
+            file_date: Date (or modification timestamp) to use for folder structure
             
         Returns:
             Created directory path
         """
-        # Format: Category/YYYY/MMM (e.g., Pictures/2025/Dec)
-        year = file_date.strftime("%Y")
-        month = file_date.strftime("%b")  # Three-letter month abbreviation
+        return Path(self._create_destination_dir(os.fspath(base_dir), category, file_date))
+    
+    def _create_destination_dir(
+        self, base_dir: str, category: str, file_date: Union[datetime, float]
+    ) -> str:
+        """
+        String-based implementation of create_destination_path().
         
-        destination_dir = base_dir / category / year / month
+        Args:
+            base_dir: Base directory for organization
+            category: File category (Pictures, Documents, etc.)
+            file_date: Date (or modification timestamp) to use for folder structure
+            
+        Returns:
+            Created directory path
+        """
+        destination_dir = os.path.join(base_dir, *self.get_destination_parts(category, file_date))
+        
+        # Skip the mkdir syscalls for directories we've already created
+        if destination_dir in self._known_dirs:
+            return destination_dir
         
         # Create all necessary directories
-        destination_dir.mkdir(parents=True, exist_ok=True)
+        os.makedirs(destination_dir, exist_ok=True)
+        self._known_dirs.add(destination_dir)
         
         return destination_dir
     
@@ -51,24 +170,139 @@ class FileMover:
         Returns:
             Available path with suffix if needed (e.g., file(1).pdf)
         """
-        if not destination.exists():
+        return Path(self._available_path(os.fspath(destination)))
+    
+    def _available_path(self, destination: str) -> str:
+        """
+        String-based implementation of handle_duplicate().
+        
+        Args:
+            destination: Intended destination path
+            
+        Returns:
+            Available path with suffix if needed (e.g., file(1).pdf)
+        """
+        if not os.path.exists(destination):
             return destination
+        return self._next_free_path(destination)
+    
+    def _next_free_path(self, destination: str) -> str:
+        """
+        Pick a "stem(N)suffix" name for a destination that is already taken.
         
+        Args:
+            destination: Intended destination path (known to exist)
+            
+        Returns:
+            Available path with numeric suffix (e.g., file(1).pdf)
+        """
         # Extract filename parts
-        stem = destination.stem  # filename without extension
-        suffix = destination.suffix  # extension including the dot
-        parent = destination.parent
+        parent, name = os.path.split(destination)
+        stem, suffix = os.path.splitext(name)  # suffix includes the dot
+        
+        # Pick the number after the highest existing "stem(N)suffix", matched
+        # with plain string operations rather than a per-call regex
+        head = f"{stem}("
+        tail = f"){suffix}"
+        min_length = len(head) + len(tail)
+        
+        def suffix_number(candidate: str) -> int:
+            if (len(candidate) > min_length
+                    and candidate.startswith(head) and candidate.endswith(tail)):
+                number = candidate[len(head):-len(tail)]
+                # isdecimal() (unlike isdigit()) only accepts what int() can parse
+                if number.isdecimal():
+                    return int(number)
+            return 0
         
-        # Find the next available number
-        counter = 1
+        names = self._get_dir_contents(parent)
+        if name not in names:
+            # The file we collided with isn't in the snapshot, so it is stale:
+            # re-read the folder once now rather than after a failed probe
+            names = self._get_dir_contents(parent, refresh=True)
+        counter = 0
         while True:
+            # Never retry a number that was taken: on case-insensitive
+            # filesystems "Report(1).pdf" blocks "report(1).pdf" without
+            # showing up in the case-sensitive scan
+            counter = max(counter + 1, max(map(suffix_number, names), default=0) + 1)
             new_name = f"{stem}({counter}){suffix}"
-            new_path = parent / new_name
-            if not new_path.exists():
+            new_path = os.path.join(parent, new_name)
+            if not os.path.exists(new_path):
+                names.add(new_name)
                 return new_path
-            counter += 1
+            # Snapshot may be stale (files added by someone else), re-read it
+            names = self._get_dir_contents(parent, refresh=True)
+    
+    def _get_dir_contents(self, directory: str, refresh: bool = False) -> Set[str]:
+        """
+        Get the cached set of filenames in a directory, listing it if needed.
+        
+        Args:
+            directory: Directory to list
+            refresh: Re-read the directory even if it is cached
+            
+        Returns:
+            Set of filenames in the directory
+        """
+        names = self._dir_contents.get(directory)
+        if names is None or refresh:
+            names = set(os.listdir(directory))
+            self._dir_contents[directory] = names
+        return names
+    
+    def _relocate(self, source: str, destination: str) -> None:
+        """
+        Moves a file, using a single rename when possible.
+        
+        Args:
+            source: Source file path
+            destination: Final destination path (must not already exist)
+            
+        Raises:
+            OSError: If file operation fails
+        """
+        try:
+            # Same filesystem: one atomic rename, no extra stat/copystat calls
+            os.replace(source, destination)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            # Different filesystems: fall back to copy + delete
+            self._cross_device_move(source, destination)
     
-    def move_file(self, source: Path, destination_dir: Path, category: str, file_date: datetime) -> Path:
+    def _cross_device_move(self, source: str, destination: str) -> None:
+        """
+        Moves a file to another filesystem by copying it and deleting the source.
+        
+        shutil.copyfile uses the kernel's zero-copy paths (copy_file_range/
+        sendfile) where available. Unlike shutil.move, only the timestamps are
+        carried over (the folder layout depends on them); permission bits,
+        flags and extended attributes are not copied.
+        
+        Args:
+            source: Source file path
+            destination: Final destination path (must not already exist)
+            
+        Raises:
+            OSError: If file operation fails
+        """
+        source_stat = os.stat(source)
+        try:
+            shutil.copyfile(source, destination)
+            os.utime(destination, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
+        except BaseException:
+            # Don't leave a partial copy behind
+            try:
+                os.unlink(destination)
+            except OSError:
+                pass
+            raise
+        os.unlink(source)
+    
+    def move_file(
+        self, source: Path, destination_dir: Path, category: str, file_date: Union[datetime, float]
+    ) -> Path:
         """
         Moves a file to the destination with date-based folder structure.
         
@@ -76,30 +310,91 @@ class FileMover:
             source: Source file path
             destination_dir: Base destination directory
             category: File category (Pictures, Documents, etc.)
-            file_date: Date to use for folder structure
+            file_date: Date (or modification timestamp) to use for folder structure
             
         Returns:
-            Final destination path where file was moved
+            Final destination path where file was moved (the source path if it
+            was already in place)
             
         Raises:
             OSError: If file operation fails
         """
-        # Create the destination directory structure
-        dest_folder = self.create_destination_path(destination_dir, category, file_date)
+        return Path(self.move_file_str(
+            os.fspath(source), os.fspath(destination_dir), category, file_date
+        ))
+    
+    def move_file_str(
+        self, source: str, destination_dir: str, category: str, file_date: Union[datetime, float]
+    ) -> str:
+        """
+        Variant of move_file() that takes and returns plain string paths.
         
-        # Determine final destination path
-        intended_destination = dest_folder / source.name
-        final_destination = self.handle_duplicate(intended_destination)
+        Used on the organizer's hot path to avoid building Path objects
+        for every file.
         
-        # Log if we had to rename due to duplicate
-        if final_destination != intended_destination:
-            self.logger.info(
-                f"Duplicate detected: '{source.name}' renamed to '{final_destination.name}'"
-            )
+        Args:
+            source: Source file path
+            destination_dir: Base destination directory
+            category: File category (Pictures, Documents, etc.)
+            file_date: Date (or modification timestamp) to use for folder structure
+            
+        Returns:
+            Final destination path where file was moved (the source path if it
+            was already in place)
+            
+        Raises:
+            OSError: If file operation fails
+        """
+        # Create the destination directory structure
+        dest_folder = self._create_destination_dir(destination_dir, category, file_date)
+        
+        # Already organized (e.g., re-run on a sorted tree): nothing to do, and
+        # handle_duplicate would otherwise rename the file against itself
+        source_dir, source_name = os.path.split(source)
+        if source_dir == dest_folder:
+            self.logger.debug("Already organized: '%s'", source)
+            return source
         
-        # Move the file
-        shutil.move(str(source), str(final_destination))
+        # Resolve duplicates and move while holding the folder lock, so two
+        # threads can't both pick the same free name
+        with self._get_dir_lock(dest_folder):
+            # Determine final destination path
+            intended_destination = os.path.join(dest_folder, source_name)
+            if not os.path.exists(intended_destination):
+                final_destination = intended_destination
+            elif os.path.realpath(source) == os.path.realpath(intended_destination):
+                # Same path spelled differently (e.g. "base/Documents/.."):
+                # it is already organized. A separate hard link to the same
+                # file is not, and is handled as a duplicate below.
+                self.logger.debug("Already organized: '%s'", intended_destination)
+                return intended_destination
+            else:
+                final_destination = self._next_free_path(intended_destination)
+            
+            # Log if we had to rename due to duplicate
+            if final_destination != intended_destination:
+                self.logger.info(
+                    "Duplicate detected: '%s' renamed to '%s'",
+                    source_name, os.path.basename(final_destination)
+                )
+            
+            # Move the file
+            try:
+                self._relocate(source, final_destination)
+            except FileNotFoundError:
+                # The cached destination folder may have been deleted meanwhile
+                if not os.path.exists(source):
+                    raise
+                self._known_dirs.discard(dest_folder)
+                self._dir_contents.pop(dest_folder, None)
+                os.makedirs(dest_folder, exist_ok=True)
+                self._known_dirs.add(dest_folder)
+                self._relocate(source, final_destination)
+            
+            # Keep the folder snapshot current for later duplicate checks
+            if dest_folder in self._dir_contents:
+                self._dir_contents[dest_folder].add(os.path.basename(final_destination))
         
-        self.logger.info(f"Moved: '{source}' -> '{final_destination}'")
+        self.logger.info("Moved: '%s' -> '%s'", source, final_destination)
         
         return final_destination
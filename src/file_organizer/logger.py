@@ -1,22 +1,90 @@
 """Logging configuration for File Organization Bot."""
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
+
+
+# Number of records buffered before the log file is written
+FILE_LOG_BUFFER_SIZE = 1024
+
+# Longest time a buffered record waits before the log file is written (seconds)
+FILE_LOG_FLUSH_INTERVAL = 1.0
+
+# Background listeners writing queued records, one per configured logger
+_listeners: Dict[str, logging.handlers.QueueListener] = {}
+
+
+def _stop_listeners() -> None:
+    """Flush and stop all background log listeners."""
+    for listener in _listeners.values():
+        listener.stop()
+        # Closing the buffered file handler writes out its pending records
+        for handler in listener.handlers:
+            handler.close()
+    _listeners.clear()
+
+
+atexit.register(_stop_listeners)
+
+
+class _BufferedFileHandler(logging.handlers.MemoryHandler):
+    """
+    MemoryHandler that also writes out its buffer once it is old enough.
+    
+    The buffer is written when it is full, on warnings and errors, and at
+    the first record logged FILE_LOG_FLUSH_INTERVAL seconds after the last write.
+    """
+    
+    def __init__(self, target: logging.Handler):
+        """
+        Initialize the handler.
+        
+        Args:
+            target: Handler receiving the buffered records
+        """
+        super().__init__(
+            capacity=FILE_LOG_BUFFER_SIZE, flushLevel=logging.WARNING, target=target
+        )
+        self._last_flush = time.monotonic()
+    
+    def shouldFlush(self, record: logging.LogRecord) -> bool:
+        """Check whether the buffer should be written after adding a record."""
+        return (
+            super().shouldFlush(record)
+            or time.monotonic() - self._last_flush >= FILE_LOG_FLUSH_INTERVAL
+        )
+    
+    def flush(self) -> None:
+        """Write the buffered records to the target handler."""
+        super().flush()
+        self._last_flush = time.monotonic()
 
 
 def setup_logger(
     name: str = "file_organizer",
     log_file: Optional[Path] = None,
-    level: int = logging.INFO
+    level: int = logging.INFO,
+    buffered: bool = False
 ) -> logging.Logger:
     """
     Configure and return a logger instance.
     
+    Records are put on an in-memory queue and written to the console and
+    log file by a background thread, so logging never blocks file moves.
+    With buffered=True, file output is written in batches (see
+    _BufferedFileHandler); otherwise every record is written as it arrives.
+    
     Args:
         name: Logger name
         log_file: Optional path to log file for file-based logging
         level: Logging level (default: INFO)
+        buffered: Batch file writes; meant for short runs that log heavily
+            (organize mode), not for long-running watch mode
         
     Returns:
         Configured logger instance
@@ -26,6 +94,13 @@ def setup_logger(
     
     # Remove existing handlers to avoid duplicates
     logger.handlers.clear()
+    previous = _listeners.pop(name, None)
+    if previous is not None:
+        previous.stop()
+        for handler in previous.handlers:
+            handler.close()
+    
+    handlers = []
     
     # Create formatter with timestamps
     formatter = logging.Formatter(
@@ -37,9 +112,10 @@ def setup_logger(
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(level)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers.append(console_handler)
     
     # File handler - optional
+    file_error = None
     if log_file:
         try:
             # Ensure parent directory exists
@@ -48,10 +124,27 @@ def setup_logger(
             file_handler = logging.FileHandler(log_file, mode='a', encoding='utf-8')
             file_handler.setLevel(level)
             file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
             
-            logger.info(f"File logging enabled: {log_file}")
+            if buffered:
+                # Write to the file in batches; warnings are flushed immediately
+                buffered_handler = _BufferedFileHandler(file_handler)
+                buffered_handler.setLevel(level)
+                handlers.append(buffered_handler)
+            else:
+                handlers.append(file_handler)
         except Exception as e:
-            logger.error(f"Failed to enable file logging: {e}")
+            file_error = e
+    
+    # Only the queue handler runs on the calling thread
+    log_queue: queue.Queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _listeners[name] = listener
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    if file_error is not None:
+        logger.error("Failed to enable file logging: %s", file_error)
+    elif log_file:
+        logger.info("File logging enabled: %s", log_file)
     
     return logger
@@ -1,10 +1,16 @@
 """Core file organization logic."""
+import errno
 import os
+import heapq
+import itertools
 import logging
+import stat
+import threading
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .categorizer import FileCategorizer
 from .file_mover import FileMover
@@ -21,22 +27,51 @@ def is_path_inside(child: Path, parent: Path) -> bool:
     Returns:
         True if child is inside parent
     """
+    resolved_parent = os.path.realpath(parent)
+    resolved_child = os.path.realpath(child)
     try:
-        child.resolve().relative_to(parent.resolve())
-        return True
+        return os.path.commonpath([resolved_child, resolved_parent]) == resolved_parent
     except ValueError:
+        # Different drives on Windows
         return False
 
 
+# Temporary and in-progress download files that must not be moved yet
+_SKIP_SUFFIXES = ('.tmp', '.temp', '.crdownload', '.part')
+
+
+def _is_ignored_name(name: str) -> bool:
+    """
+    Check if a filename belongs to a hidden or temporary file.
+    
+    Args:
+        name: Filename to check
+        
+    Returns:
+        True if the file should be skipped
+    """
+    # Skip hidden files (starting with .) and temporary/partial downloads
+    return name[0:1] == '.' or name.endswith(_SKIP_SUFFIXES)
+
+
+# Errors that usually mean another process still holds the file, so the move
+# is worth retrying (Windows reports sharing violations as EACCES)
+_RETRYABLE_ERRNOS = frozenset({errno.EACCES, errno.EPERM, errno.EBUSY})
+
+
 class FileOrganizer:
     """Coordinates file categorization and movement operations."""
     
+    # Delay before the first retry of a locked file, doubled on each attempt (seconds)
+    RETRY_BASE_DELAY = 1.0
+    
     def __init__(
         self,
         base_path: Path,
         categorizer: FileCategorizer,
         file_mover: FileMover,
-        logger: Optional[logging.Logger] = None
+        logger: Optional[logging.Logger] = None,
+        max_workers: int = 1
     ):
         """
         Initialize the file organizer.
@@ -46,11 +81,23 @@ class FileOrganizer:
             categorizer: FileCategorizer instance
             file_mover: FileMover instance
             logger: Logger instance for operation tracking
+            max_workers: Number of files to move concurrently in organize_all (1 = sequential)
         """
         self.base_path = Path(base_path)
         self.categorizer = categorizer
         self.file_mover = file_mover
         self.logger = logger or logging.getLogger(__name__)
+        self.max_workers = max(1, max_workers)
+        self._base_dir = str(self.base_path)
+        
+        # Locked files waiting for a retry, as a heap ordered by due time.
+        # A background thread reschedules them so workers never sleep.
+        self._retry_heap: List[Tuple[float, int, Any]] = []
+        self._retry_cond = threading.Condition()
+        self._retry_seq = itertools.count()
+        self._retry_thread: Optional[threading.Thread] = None
+        self._pending_retries = 0
+        self._retry_successes = 0
         
         # Validate base path exists
         if not self.base_path.exists():
@@ -58,101 +105,240 @@ class FileOrganizer:
         if not self.base_path.is_dir():
             raise ValueError(f"Base path is not a directory: {self.base_path}")
     
-    def _get_file_date(self, file_path: Path) -> datetime:
+    def _get_file_date(self, stat_result: os.stat_result) -> int:
         """
-        Extract file modification date.
+        Extract file modification date from an existing stat result.
         
         Args:
-            file_path: Path to the file
+            stat_result: Stat result of the file
             
         Returns:
-            Datetime object representing file modification time
+            Modification time as a timestamp in whole seconds
         """
-        timestamp = os.path.getmtime(file_path)
-        return datetime.fromtimestamp(timestamp)
+        return int(stat_result.st_mtime)
     
-    def _should_process_file(self, file_path: Path) -> bool:
+    def _should_process_file(self, file_path: Path, stat_result: os.stat_result) -> bool:
         """
         Determine if a file should be processed.
         
         Args:
             file_path: Path to check
+            stat_result: lstat() result of the path
             
         Returns:
             True if file should be processed, False otherwise
         """
-        # Skip if not a file
-        if not file_path.is_file():
-            return False
-        
-        # Skip hidden files (starting with .)
-        if file_path.name.startswith('.'):
+        # Skip if it's a symlink
+        if stat.S_ISLNK(stat_result.st_mode):
+            self.logger.debug("Skipping symlink: %s", file_path)
             return False
         
-        # Skip if it's a symlink
-        if file_path.is_symlink():
-            self.logger.debug(f"Skipping symlink: {file_path}")
+        # Skip if not a file
+        if not stat.S_ISREG(stat_result.st_mode):
             return False
         
-        # Skip temporary files
-        if file_path.name.endswith('.tmp') or file_path.name.endswith('.temp'):
+        # Skip hidden and temporary files
+        if _is_ignored_name(file_path.name):
             return False
         
         return True
     
-    def organize_file(self, file_path: Path, max_retries: int = 3) -> bool:
+    def organize_file(
+        self, file_path: Path, max_retries: int = 3, stat_result: Optional[os.stat_result] = None
+    ) -> Optional[bool]:
         """
         Organizes a single file into the appropriate category/date folder.
         
         Args:
             file_path: Path to the file to organize
             max_retries: Maximum number of retry attempts for locked files
+            stat_result: Pre-fetched lstat() result of the file, if the caller has one
             
         Returns:
-            True if successful, False otherwise
+            True if successful, False otherwise, None if the file is locked
+            and has been queued for a retry
         """
         try:
-            # Validate file should be processed
-            if not self._should_process_file(file_path):
-                return False
+            # One lstat answers type, symlink and date questions (and proves the
+            # file still exists)
+            if stat_result is None:
+                try:
+                    stat_result = file_path.lstat()
+                except FileNotFoundError:
+                    return False
             
-            # Check if file still exists (may have been moved by another process)
-            if not file_path.exists():
-                self.logger.warning(f"File no longer exists: {file_path}")
+            # Validate file should be processed
+            if not self._should_process_file(file_path, stat_result):
                 return False
             
-            # Determine category
-            category = self.categorizer.get_category(file_path)
-            self.logger.info(f"Detected file: '{file_path.name}' -> Category: {category}")
-            
-            # Get file date
-            file_date = self._get_file_date(file_path)
+            # Determine category and file date
+            category = self.categorizer.get_category_from_name(file_path.name)
+            file_date = self._get_file_date(stat_result)
             
-            # Move the file with retry logic for locked files
-            for attempt in range(max_retries):
-                try:
-                    self.file_mover.move_file(file_path, self.base_path, category, file_date)
-                    return True
-                except PermissionError as e:
-                    if attempt < max_retries - 1:
-                        # File might be locked, wait and retry with exponential backoff
-                        wait_time = 2 ** attempt  # 1s, 2s, 4s
-                        self.logger.warning(
-                            f"File locked, retrying in {wait_time}s (attempt {attempt + 1}/{max_retries}): {file_path}"
-                        )
-                        time.sleep(wait_time)
-                    else:
-                        self.logger.error(f"Permission denied after {max_retries} attempts for '{file_path}': {e}")
-                        return False
-                except OSError as e:
-                    # Handle disk space and other OS errors (don't retry these)
-                    self.logger.error(f"Failed to move '{file_path}': {e}")
-                    return False
+            return self._organize(os.fspath(file_path), category, file_date, max_retries)
                 
         except Exception as e:
-            self.logger.error(f"Unexpected error organizing '{file_path}': {e}")
+            self.logger.error("Unexpected error organizing '%s': %s", file_path, e)
+            return False
+    
+    def _classify_entry(self, entry: os.DirEntry) -> Optional[Tuple[str, int]]:
+        """
+        Decide whether a directory entry should be organized, in a single pass.
+        
+        Uses the entry's cached lstat result, so filtering, categorization
+        and the modification time all come from one metadata lookup.
+        
+        Args:
+            entry: Directory entry from os.scandir()
+            
+        Returns:
+            Tuple of (category, mtime in seconds), or None if the file should be skipped
+        """
+        st = entry.stat(follow_symlinks=False)
+        
+        # Skip anything that isn't a regular file (directories, symlinks, ...)
+        if not stat.S_ISREG(st.st_mode):
+            return None
+        
+        name = entry.name
+        if _is_ignored_name(name):
+            return None
+        
+        return self.categorizer.get_category_from_name(name), int(st.st_mtime)
+    
+    def _organize(
+        self,
+        file_path: str,
+        category: str,
+        file_date: int,
+        max_retries: int,
+        attempt: int = 0
+    ) -> Optional[bool]:
+        """
+        Moves a file that has already passed validation.
+        
+        Args:
+            file_path: Path to the file to organize
+            category: File category (Pictures, Documents, etc.)
+            file_date: Modification timestamp in seconds to use for folder structure
+            max_retries: Maximum number of retry attempts for locked files
+            attempt: Number of attempts already made
+            
+        Returns:
+            True if successful, False otherwise, None if queued for a retry
+        """
+        if attempt == 0:
+            self.logger.info(
+                "Detected file: '%s' -> Category: %s", os.path.basename(file_path), category
+            )
+        
+        try:
+            self.file_mover.move_file_str(file_path, self._base_dir, category, file_date)
+            return True
+        except OSError as e:
+            # One handler, dispatched on errno
+            if e.errno in _RETRYABLE_ERRNOS or isinstance(e, PermissionError):
+                if attempt < max_retries - 1:
+                    # File might be locked, retry later with exponential backoff
+                    wait_time = self.RETRY_BASE_DELAY * 2 ** attempt  # 1s, 2s, 4s
+                    self.logger.warning(
+                        "File locked, retrying in %gs (attempt %d/%d): %s",
+                        wait_time, attempt + 1, max_retries, file_path
+                    )
+                    self._schedule_retry(wait_time, (file_path, category, file_date, max_retries, attempt + 1))
+                    return None
+                self.logger.error("File still locked after %d attempts for '%s': %s", max_retries, file_path, e)
+            elif e.errno == errno.ENOENT or isinstance(e, FileNotFoundError):
+                # Moved or deleted by someone else since it was listed
+                self.logger.warning("File no longer exists: %s", file_path)
+            else:
+                # Handle disk space and other OS errors (don't retry these)
+                self.logger.error("Failed to move '%s': %s", file_path, e)
             return False
     
+    def _schedule_retry(self, delay: float, task: Tuple) -> None:
+        """
+        Queue a locked file to be moved again after a delay.
+        
+        Args:
+            delay: Seconds to wait before retrying
+            task: Arguments for _organize()
+        """
+        with self._retry_cond:
+            heapq.heappush(self._retry_heap, (time.monotonic() + delay, next(self._retry_seq), task))
+            self._pending_retries += 1
+            if self._retry_thread is None:
+                self._retry_thread = threading.Thread(
+                    target=self._retry_loop, name="file-organizer-retry", daemon=True
+                )
+                self._retry_thread.start()
+            self._retry_cond.notify_all()
+    
+    def _retry_loop(self) -> None:
+        """
+        Background worker that retries locked files once they are due.
+        """
+        while True:
+            with self._retry_cond:
+                while not self._retry_heap or self._retry_heap[0][0] > time.monotonic():
+                    timeout = self._retry_heap[0][0] - time.monotonic() if self._retry_heap else None
+                    self._retry_cond.wait(timeout)
+                _, _, task = heapq.heappop(self._retry_heap)
+            
+            file_path = task[0]
+            try:
+                result = self._organize(*task)
+            except Exception as e:
+                self.logger.error("Unexpected error organizing '%s': %s", file_path, e)
+                result = False
+            
+            with self._retry_cond:
+                self._pending_retries -= 1
+                if result:
+                    self._retry_successes += 1
+                self._retry_cond.notify_all()
+    
+    def wait_for_retries(self) -> int:
+        """
+        Block until every queued retry has either succeeded or given up.
+        
+        Returns:
+            Total number of files moved by retries so far
+        """
+        with self._retry_cond:
+            while self._pending_retries:
+                self._retry_cond.wait()
+            return self._retry_successes
+    
+    def _organize_batch(self, batch: List[Tuple[str, str, int]]) -> int:
+        """
+        Moves a group of files that share the same destination folder.
+        
+        Args:
+            batch: List of (path, category, mtime) tuples
+            
+        Returns:
+            Number of files successfully organized
+        """
+        _, category, mtime = batch[0]
+        try:
+            self.file_mover.prepare_destination(self._base_dir, category, mtime)
+        except OSError as e:
+            # Still try each file: the moves create the folder themselves and
+            # report their own errors
+            self.logger.warning("Failed to prepare destination for '%s': %s", batch[0][0], e)
+        
+        # Bound once: this loop runs for every file in the folder
+        organize = self._organize
+        count = 0
+        for file_path, category, mtime in batch:
+            try:
+                if organize(file_path, category, mtime, max_retries=3):
+                    count += 1
+            except Exception as e:
+                self.logger.error("Unexpected error organizing '%s': %s", file_path, e)
+        return count
+    
     def organize_all(self) -> int:
         """
         Organizes all files in the base directory.
@@ -160,16 +346,51 @@ class FileOrganizer:
         Returns:
             Number of files successfully organized
         """
-        self.logger.info(f"Starting organization of: {self.base_path}")
+        self.logger.info("Starting organization of: %s", self.base_path)
         
-        count = 0
-        files = [f for f in self.base_path.iterdir() if f.is_file()]
+        retried_before = self.wait_for_retries()
+        
+        # A single directory listing gives us file types for free; mtime and
+        # category then come from one cached stat per entry
+        with os.scandir(self.base_path) as it:
+            entries = [entry for entry in it if entry.is_file(follow_symlinks=False)]
+        
+        self.logger.info("Found %d files to process", len(entries))
+        
+        # Group files by destination folder so each folder is created and
+        # listed once, and moves into the same folder happen back to back
+        buckets: Dict[Tuple[str, str, str], List[Tuple[str, str, int]]] = defaultdict(list)
+        classify = self._classify_entry
+        get_destination_parts = self.file_mover.get_destination_parts
+        for entry in entries:
+            try:
+                classified = classify(entry)
+                if classified is None:
+                    continue
+                category, mtime = classified
+                key = get_destination_parts(category, mtime)
+            except FileNotFoundError:
+                self.logger.warning("File no longer exists: %s", entry.path)
+                continue
+            except Exception as e:
+                # e.g. an mtime localtime() can't convert; skip just this file
+                self.logger.error("Unexpected error organizing '%s': %s", entry.path, e)
+                continue
+            buckets[key].append((entry.path, category, mtime))
+        batches = [buckets[key] for key in sorted(buckets)]
         
-        self.logger.info(f"Found {len(files)} files to process")
+        if self.max_workers > 1:
+            # Moves are I/O-bound, so threads overlap the syscall latency.
+            # Moves into one folder are serialized anyway, so each worker
+            # takes a whole folder.
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = [executor.submit(self._organize_batch, batch) for batch in batches]
+                count = sum(future.result() for future in as_completed(futures))
+        else:
+            count = sum(self._organize_batch(batch) for batch in batches)
         
-        for file_path in files:
-            if self.organize_file(file_path):
-                count += 1
+        # Include locked files that were moved by a later retry
+        count += self.wait_for_retries() - retried_before
         
-        self.logger.info(f"Organization complete. Processed {count} files.")
+        self.logger.info("Organization complete. Processed %d files.", count)
         return count
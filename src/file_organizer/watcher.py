@@ -1,17 +1,103 @@
 """Real-time file system monitoring."""
+import os
+import re
+import sys
+import heapq
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
-from threading import Timer
+from typing import Dict, List, Optional, Tuple
+from threading import Condition, Event, Thread
 
 from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler, FileCreatedEvent
+from watchdog.observers.polling import PollingObserver
+from watchdog.events import (
+    FileSystemEventHandler, PatternMatchingEventHandler, FileCreatedEvent, FileModifiedEvent,
+    FileMovedEvent
+)
 
-from .organizer import FileOrganizer
+from .organizer import FileOrganizer, _SKIP_SUFFIXES, _is_ignored_name
 
+try:
+    # Optional: talk to inotify directly on Linux (pip install inotify_simple)
+    import inotify_simple
+except ImportError:
+    inotify_simple = None
 
-class FileEventHandler(FileSystemEventHandler):
+
+# Filesystem types whose changes made by other machines never reach
+# inotify/FSEvents/ReadDirectoryChanges
+_REMOTE_FS_TYPES = frozenset({
+    "nfs", "nfs4", "cifs", "smbfs", "smb3", "afs", "ncpfs", "9p",
+    "davfs", "fuse.sshfs", "fuse.rclone",
+})
+
+
+# Octal escapes the kernel uses for special characters in /proc/mounts
+# fields (\040 space, \011 tab, \012 newline, \134 backslash)
+_MOUNT_ESCAPE = re.compile(r"\\([0-7]{3})")
+
+
+def _unescape_mount_field(field: str) -> str:
+    """
+    Decode the octal escapes in a /proc/mounts field.
+    
+    Args:
+        field: Raw field, e.g. "/mnt/my\\040share"
+        
+    Returns:
+        Decoded field, e.g. "/mnt/my share"
+    """
+    return _MOUNT_ESCAPE.sub(lambda match: chr(int(match.group(1), 8)), field)
+
+
+def is_remote_filesystem(path: Path) -> bool:
+    """
+    Check if a path lives on a network filesystem (NFS, SMB, ...).
+    
+    Args:
+        path: Path to check
+        
+    Returns:
+        True if the path is on a network mount, False if local or unknown
+    """
+    path_str = os.path.realpath(path)
+    
+    if sys.platform == "win32":
+        # UNC paths (\\server\share) or mapped network drives
+        if path_str.startswith("\\\\"):
+            return True
+        import ctypes
+        drive_remote = 4  # DRIVE_REMOTE from GetDriveTypeW
+        drive = os.path.splitdrive(path_str)[0] + "\\"
+        return ctypes.windll.kernel32.GetDriveTypeW(drive) == drive_remote
+    
+    # Linux: find the filesystem type of the longest matching mount point
+    try:
+        with open("/proc/mounts", encoding="utf-8") as mounts:
+            entries = [line.split() for line in mounts]
+    except OSError:
+        return False
+    
+    best_match, fs_type = "", ""
+    for fields in entries:
+        if len(fields) < 3:
+            continue
+        mount_point = _unescape_mount_field(fields[1])
+        prefix = mount_point.rstrip("/") + "/"
+        # ">=": for the same mount point, the later (over)mount is the visible one
+        if (path_str == mount_point or path_str.startswith(prefix)) and len(mount_point) >= len(best_match):
+            best_match, fs_type = mount_point, fields[2]
+    
+    return fs_type in _REMOTE_FS_TYPES
+
+
+# Event paths that are never organized: hidden files and temporary/partial downloads
+_IGNORE_PATTERNS = [".*"] + [f"*{suffix}" for suffix in _SKIP_SUFFIXES]
+
+
+class FileEventHandler(PatternMatchingEventHandler):
     """Handles file system events for the file organizer."""
     
     def __init__(self, organizer: FileOrganizer, logger: logging.Logger, debounce_seconds: float = 1.0):
@@ -23,11 +109,31 @@ class FileEventHandler(FileSystemEventHandler):
             logger: Logger instance
             debounce_seconds: Delay before processing files to ensure writes are complete
         """
-        super().__init__()
+        # Hidden files, temporary files and directories are dropped by
+        # watchdog's dispatch() before any of our callbacks run
+        super().__init__(
+            ignore_patterns=_IGNORE_PATTERNS,
+            ignore_directories=True,
+            case_sensitive=True
+        )
         self.organizer = organizer
         self.logger = logger
         self.debounce_seconds = debounce_seconds
-        self._pending_timers = {}
+        
+        # Paths waiting to be processed, mapped to their current deadline, plus
+        # a min-heap of (deadline, path). A re-fired event pushes a newer
+        # deadline; heap entries whose deadline no longer matches are stale.
+        # One debounce thread drains the heap instead of one timer per file.
+        # Paths are kept as the event's plain strings until processing.
+        self._pending_paths: Dict[str, float] = {}
+        self._deadlines: List[Tuple[float, str]] = []
+        self._condition = Condition()
+        self._closed = False
+        self._executor = ThreadPoolExecutor(max_workers=organizer.max_workers)
+        self._debounce_thread = Thread(
+            target=self._debounce_loop, name="file-organizer-debounce", daemon=True
+        )
+        self._debounce_thread.start()
     
     def on_created(self, event):
         """
@@ -36,34 +142,169 @@ class FileEventHandler(FileSystemEventHandler):
         Args:
             event: File system event
         """
-        # Ignore directory creation events
-        if event.is_directory:
-            return
+        self._enqueue(event.src_path, new=True)
+    
+    def on_modified(self, event):
+        """
+        Handle file modification events.
         
-        file_path = Path(event.src_path)
+        Writes to a file that is still waiting to be processed push its
+        processing back, so files are only moved once they stop changing.
         
-        # Cancel any existing timer for this file
-        if file_path in self._pending_timers:
-            self._pending_timers[file_path].cancel()
+        Args:
+            event: File system event
+        """
+        self._enqueue(event.src_path, new=False)
+    
+    def on_moved(self, event):
+        """
+        Handle file rename events.
+        
+        Browsers finish a download by renaming e.g. "x.pdf.crdownload" to
+        "x.pdf"; the temporary name is ignored, the final one is organized.
+        
+        Args:
+            event: File system event
+        """
+        dest_path = event.dest_path
+        with self._condition:
+            # A pending file that was renamed is tracked under its new name
+            self._pending_paths.pop(event.src_path, None)
+        if not _is_ignored_name(os.path.basename(dest_path)):
+            self._enqueue(dest_path, new=True)
+    
+    def _enqueue(self, file_path: str, new: bool) -> None:
+        """
+        (Re)start the debounce delay for a file.
         
-        # Schedule processing after debounce delay
-        timer = Timer(self.debounce_seconds, self._process_file, args=[file_path])
-        self._pending_timers[file_path] = timer
-        timer.start()
+        Args:
+            file_path: Path of the file the event refers to
+            new: Whether to start tracking the file if it isn't pending yet
+        """
+        with self._condition:
+            if not new and file_path not in self._pending_paths:
+                return
+            deadline = time.monotonic() + self.debounce_seconds
+            self._pending_paths[file_path] = deadline
+            heapq.heappush(self._deadlines, (deadline, file_path))
+            self._condition.notify()
+    
+    def _debounce_loop(self) -> None:
+        """
+        Wait for the earliest deadline, then submit every file that is due.
+        """
+        while True:
+            with self._condition:
+                ready = []
+                while not self._closed and not ready:
+                    now = time.monotonic()
+                    while self._deadlines and self._deadlines[0][0] <= now:
+                        deadline, path = heapq.heappop(self._deadlines)
+                        if self._pending_paths.get(path) == deadline:
+                            del self._pending_paths[path]
+                            ready.append(path)
+                    if not ready:
+                        timeout = self._deadlines[0][0] - now if self._deadlines else None
+                        self._condition.wait(timeout)
+                if self._closed:
+                    return
+            
+            for path in ready:
+                self._executor.submit(self._process_file, path)
     
-    def _process_file(self, file_path: Path):
+    def _process_file(self, file_path: str):
         """
         Process a file after debounce delay.
         
         Args:
             file_path: Path to the file to process
         """
+        self.organizer.organize_file(Path(file_path))
+    
+    def close(self) -> None:
+        """
+        Stop the debounce thread, drop pending files and wait for in-flight ones.
+        """
+        with self._condition:
+            self._closed = True
+            self._pending_paths.clear()
+            self._deadlines.clear()
+            self._condition.notify()
+        self._debounce_thread.join()
+        self._executor.shutdown(wait=True)
+
+
+class InotifyObserver(Thread):
+    """
+    Minimal Linux observer reading inotify events directly.
+    
+    Offers the subset of the watchdog observer API used by FileWatcher
+    (schedule/start/stop/join/is_alive) without watchdog's emitter and
+    event-queue threads. Events are dispatched straight to the handler.
+    """
+    
+    # How often the read loop checks for a stop request (milliseconds)
+    READ_TIMEOUT_MS = 1000
+    
+    def __init__(self):
+        """Initialize the observer."""
+        super().__init__(name="file-organizer-inotify", daemon=True)
+        self._stop_event = Event()
+        self._inotify = inotify_simple.INotify()
+        self._handler: Optional[FileSystemEventHandler] = None
+        self._watch_path = ""
+    
+    def schedule(self, event_handler: FileSystemEventHandler, path: str, recursive: bool = False) -> None:
+        """
+        Watch a directory (non-recursively) and send its events to a handler.
+        
+        Args:
+            event_handler: Handler receiving file events
+            path: Directory to watch
+            recursive: Not supported; must be False
+        """
+        if recursive:
+            raise ValueError("InotifyObserver only supports non-recursive watches")
+        flags = inotify_simple.flags
+        # MOVED_FROM/MOVED_TO: renames inside the folder, and files moved in
+        self._inotify.add_watch(
+            path, flags.CREATE | flags.MODIFY | flags.MOVED_FROM | flags.MOVED_TO
+        )
+        self._handler = event_handler
+        self._watch_path = path
+    
+    def run(self) -> None:
+        """Read and dispatch events until stopped."""
+        flags = inotify_simple.flags
         try:
-            self.organizer.organize_file(file_path)
+            while not self._stop_event.is_set():
+                # Source names of renames, keyed by the cookie shared by the
+                # MOVED_FROM/MOVED_TO pair (both arrive in the same read)
+                moved_from: Dict[int, str] = {}
+                for event in self._inotify.read(timeout=self.READ_TIMEOUT_MS):
+                    if event.mask & flags.ISDIR or not event.name:
+                        continue
+                    src_path = os.path.join(self._watch_path, event.name)
+                    if event.mask & flags.MOVED_FROM:
+                        moved_from[event.cookie] = src_path
+                    elif event.mask & flags.MOVED_TO:
+                        if event.cookie in moved_from:
+                            self._handler.dispatch(
+                                FileMovedEvent(moved_from.pop(event.cookie), src_path)
+                            )
+                        else:
+                            # Moved in from outside the folder: a new file
+                            self._handler.dispatch(FileCreatedEvent(src_path))
+                    elif event.mask & flags.CREATE:
+                        self._handler.dispatch(FileCreatedEvent(src_path))
+                    elif event.mask & flags.MODIFY:
+                        self._handler.dispatch(FileModifiedEvent(src_path))
         finally:
-            # Clean up timer reference
-            if file_path in self._pending_timers:
-                del self._pending_timers[file_path]
+            self._inotify.close()
+    
+    def stop(self) -> None:
+        """Ask the read loop to exit; it stops within READ_TIMEOUT_MS."""
+        self._stop_event.set()
 
 
 class FileWatcher:
@@ -74,7 +315,8 @@ class FileWatcher:
         watch_path: Path,
         organizer: FileOrganizer,
         logger: Optional[logging.Logger] = None,
-        debounce_seconds: float = 1.0
+        debounce_seconds: float = 1.0,
+        polling_interval: float = 2.0
     ):
         """
         Initialize the file watcher.
@@ -84,6 +326,7 @@ class FileWatcher:
             organizer: FileOrganizer instance to handle detected files
             logger: Logger instance
             debounce_seconds: Delay before processing files
+            polling_interval: Seconds between directory scans on network filesystems
         """
         self.watch_path = Path(watch_path)
         self.organizer = organizer
@@ -98,14 +341,48 @@ class FileWatcher:
         
         # Create event handler and observer
         self.event_handler = FileEventHandler(organizer, self.logger, debounce_seconds)
-        self.observer = Observer()
+        self.observer = self._create_observer(polling_interval)
+        self.logger.info("Using %s backend", type(self.observer).__name__)
+    
+    def _create_observer(self, polling_interval: float):
+        """
+        Pick the cheapest observer that sees every change in the watch path.
+        
+        Args:
+            polling_interval: Seconds between directory scans on network filesystems
+            
+        Returns:
+            Observer instance (not yet scheduled or started)
+        """
+        if is_remote_filesystem(self.watch_path):
+            # Native notifications miss changes made on other machines, so
+            # compare directory snapshots (one scandir per poll) instead
+            self.logger.info(
+                "Network filesystem detected, polling every %gs", polling_interval
+            )
+            return PollingObserver(timeout=polling_interval)
+        
+        if sys.platform.startswith("linux") and inotify_simple is not None:
+            try:
+                # Skip watchdog's emitter thread and event queue
+                return InotifyObserver()
+            except OSError as e:
+                # e.g. the per-user inotify instance limit is reached
+                self.logger.warning("Cannot use inotify directly (%s), using watchdog", e)
+        
+        if issubclass(Observer, PollingObserver):
+            # watchdog found no native API for this platform
+            self.logger.warning(
+                "No native file notification support, falling back to polling"
+            )
+        return Observer()
     
     def start(self) -> None:
         """
         Starts monitoring the directory for file system events.
         Blocks until stopped with Ctrl+C or stop() is called.
         """
-        self.logger.info(f"Starting file watcher on: {self.watch_path}")
+        self.logger.info("Starting file watcher on: %s", self.watch_path)
         self.logger.info("Press Ctrl+C to stop watching...")
         
         # Schedule the observer
@@ -127,4 +404,5 @@ class FileWatcher:
         self.logger.info("Stopping file watcher...")
         self.observer.stop()
         self.observer.join()
+        self.event_handler.close()
         self.logger.info("File watcher stopped")
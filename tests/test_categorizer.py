@@ -77,3 +77,28 @@ class TestFileCategorizer:
         # Test mixed case
         assert categorizer.get_category(Path("test.PdF")) == "Documents"
         assert categorizer.get_category(Path("test.JpG")) == "Pictures"
+    
+    def test_subclass_custom_categories(self):
+        """Test that subclasses defining CATEGORIES get their own mapping."""
+        class CustomCategorizer(FileCategorizer):
+            CATEGORIES = {
+                **FileCategorizer.CATEGORIES,
+                "Code": {"py", "js"},
+            }
+        
+        custom = CustomCategorizer()
+        assert custom.get_category(Path("script.py")) == "Code"
+        assert custom.get_category(Path("photo.jpg")) == "Pictures"
+        
+        # The base class mapping is unaffected
+        assert FileCategorizer().get_category(Path("script.py")) == "Others"
+    
+    def test_get_category_from_name(self):
+        """Test categorization from raw filename strings."""
+        categorizer = FileCategorizer()
+        
+        assert categorizer.get_category_from_name("report.PDF") == "Documents"
+        assert categorizer.get_category_from_name("archive.tar.gz") == "Archives"
+        assert categorizer.get_category_from_name("README") == "Others"
+        assert categorizer.get_category_from_name("trailing.") == "Others"
+        assert categorizer.get_category_from_name(".pdf") == "Others"
@@ -125,3 +125,155 @@ class TestFileMover:
         assert "Documents" in str(result)
         assert "2025" in str(result)
         assert "Dec" in str(result)
+    
+    def test_move_file_recreates_deleted_destination(self, temp_dir, sample_date):
+        """Test that a cached destination folder is recreated if it was removed."""
+        logger = logging.getLogger("test")
+        mover = FileMover(logger)
+        
+        first = temp_dir / "first.pdf"
+        first.write_text("first")
+        moved = mover.move_file(first, temp_dir, "Documents", sample_date)
+        
+        # Remove the destination folder behind the mover's back
+        moved.unlink()
+        moved.parent.rmdir()
+        
+        second = temp_dir / "second.pdf"
+        second.write_text("second")
+        result = mover.move_file(second, temp_dir, "Documents", sample_date)
+        
+        assert not second.exists()
+        assert result.read_text() == "second"
+    
+    def test_move_file_cross_device_fallback(self, temp_dir, sample_date, monkeypatch):
+        """Test that moves across filesystems fall back to copy + delete."""
+        import errno
+        import os
+        
+        logger = logging.getLogger("test")
+        mover = FileMover(logger)
+        
+        def fake_replace(src, dst):
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+        
+        monkeypatch.setattr(os, "replace", fake_replace)
+        
+        source = temp_dir / "test.pdf"
+        source.write_text("test content")
+        os.utime(source, (1700000000, 1700000000))
+        
+        result = mover.move_file(source, temp_dir, "Documents", sample_date)
+        
+        assert not source.exists()
+        assert result.read_text() == "test content"
+        # Modification time is kept, since the folder layout depends on it
+        assert result.stat().st_mtime == 1700000000
+    
+    def test_handle_duplicate_case_insensitive_filesystem(self, temp_dir, monkeypatch):
+        """Test that duplicates resolve when names only differ in case."""
+        import os
+        import threading
+        
+        (temp_dir / "Report.pdf").write_text("first")
+        (temp_dir / "Report(1).pdf").write_text("second")
+        
+        real_listdir = os.listdir
+        
+        def case_insensitive_exists(path):
+            parent, name = os.path.split(os.fspath(path))
+            return name.casefold() in {entry.casefold() for entry in real_listdir(parent)}
+        
+        monkeypatch.setattr(os.path, "exists", case_insensitive_exists)
+        
+        logger = logging.getLogger("test")
+        mover = FileMover(logger)
+        result = []
+        worker = threading.Thread(
+            target=lambda: result.append(mover.handle_duplicate(temp_dir / "report.pdf")),
+            daemon=True
+        )
+        worker.start()
+        worker.join(timeout=5)
+        
+        assert not worker.is_alive()
+        assert result == [temp_dir / "report(2).pdf"]
+    
+    def test_handle_duplicate_uses_highest_suffix(self, temp_dir):
+        """Test that the next suffix follows the highest existing one."""
+        logger = logging.getLogger("test")
+        mover = FileMover(logger)
+        
+        (temp_dir / "test.pdf").write_text("1")
+        (temp_dir / "test(5).pdf").write_text("2")
+        
+        assert mover.handle_duplicate(temp_dir / "test.pdf") == temp_dir / "test(6).pdf"
+        
+        # Files created behind the mover's back are still respected
+        (temp_dir / "test(7).pdf").write_text("3")
+        (temp_dir / "test(8).pdf").write_text("4")
+        assert mover.handle_duplicate(temp_dir / "test.pdf") == temp_dir / "test(9).pdf"
+    
+    def test_create_destination_path_from_timestamp(self, temp_dir, sample_date):
+        """Test that a modification timestamp gives the same folders as a datetime."""
+        logger = logging.getLogger("test")
+        mover = FileMover(logger)
+        
+        from_date = mover.create_destination_path(temp_dir, "Pictures", sample_date)
+        from_timestamp = mover.create_destination_path(
+            temp_dir, "Pictures", int(sample_date.timestamp())
+        )
+        
+        assert from_timestamp == from_date
+    
+    def test_move_file_already_in_place(self, temp_dir, sample_date):
+        """Test that a file already in its destination folder is left alone."""
+        logger = logging.getLogger("test")
+        mover = FileMover(logger)
+        
+        source = temp_dir / "test.pdf"
+        source.write_text("test content")
+        organized = mover.move_file(source, temp_dir, "Documents", sample_date)
+        
+        # Organizing the same file again must not rename it to test(1).pdf
+        result = mover.move_file(organized, temp_dir, "Documents", sample_date)
+        
+        assert result == organized
+        assert organized.exists()
+        assert not (organized.parent / "test(1).pdf").exists()
+    
+    def test_move_file_same_file_via_other_path(self, temp_dir, sample_date):
+        """Test that a file reached through a different path spelling is not duplicated."""
+        logger = logging.getLogger("test")
+        mover = FileMover(logger)
+        
+        source = temp_dir / "test.pdf"
+        source.write_text("test content")
+        organized = mover.move_file(source, temp_dir, "Documents", sample_date)
+        
+        # Same file, but the base directory is spelled differently
+        other_base = temp_dir / "Documents" / ".."
+        result = mover.move_file(organized, other_base, "Documents", sample_date)
+        
+        assert result.resolve() == organized.resolve()
+        assert organized.exists()
+        assert not (organized.parent / "test(1).pdf").exists()
+    
+    def test_move_file_hard_link_to_organized_file(self, temp_dir, sample_date):
+        """Test that a second hard link to an organized file is still moved out."""
+        import os
+        
+        logger = logging.getLogger("test")
+        mover = FileMover(logger)
+        
+        source = temp_dir / "test.pdf"
+        source.write_text("test content")
+        organized = mover.move_file(source, temp_dir, "Documents", sample_date)
+        os.link(organized, source)
+        
+        result = mover.move_file(source, temp_dir, "Documents", sample_date)
+        
+        assert not source.exists()
+        assert result == organized.parent / "test(1).pdf"
+        assert organized.exists()
+        assert result.read_text() == "test content"
@@ -0,0 +1,96 @@
+"""Unit tests for logging configuration."""
+import os
+import sys
+import time
+import logging
+import subprocess
+
+import pytest
+
+from file_organizer import logger as logger_module
+from file_organizer.logger import setup_logger
+
+
+def read_when(log_file, text, timeout=5.0):
+    """Wait until a log file contains some text, and return its contents."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if log_file.exists() and text in log_file.read_text(encoding="utf-8"):
+            break
+        time.sleep(0.02)
+    return log_file.read_text(encoding="utf-8") if log_file.exists() else ""
+
+
+@pytest.fixture(autouse=True)
+def stop_listeners():
+    """Stop the background log listeners started by a test."""
+    yield
+    logger_module._stop_listeners()
+
+
+class TestSetupLogger:
+    """Test suite for setup_logger."""
+    
+    def test_unbuffered_records_reach_file(self, temp_dir):
+        """Test that every record is written right away by default."""
+        log_file = temp_dir / "organizer.log"
+        logger = setup_logger("test_unbuffered", log_file=log_file)
+        
+        logger.info("Moved: 'a.pdf'")
+        
+        assert "Moved: 'a.pdf'" in read_when(log_file, "Moved: 'a.pdf'")
+    
+    def test_buffered_warnings_reach_file(self, temp_dir):
+        """Test that warnings are written without waiting for the buffer to fill."""
+        log_file = temp_dir / "organizer.log"
+        logger = setup_logger("test_buffered_warning", log_file=log_file, buffered=True)
+        
+        logger.info("Moved: 'a.pdf'")
+        logger.warning("File locked: 'b.pdf'")
+        
+        contents = read_when(log_file, "File locked: 'b.pdf'")
+        assert "Moved: 'a.pdf'" in contents
+        assert "File locked: 'b.pdf'" in contents
+    
+    def test_buffered_records_flushed_after_interval(self, temp_dir, monkeypatch):
+        """Test that buffered records are written once the flush interval passes."""
+        monkeypatch.setattr(logger_module, "FILE_LOG_FLUSH_INTERVAL", 0.05)
+        log_file = temp_dir / "organizer.log"
+        logger = setup_logger("test_buffered_interval", log_file=log_file, buffered=True)
+        
+        logger.info("Moved: 'a.pdf'")
+        time.sleep(0.1)
+        logger.info("Moved: 'b.pdf'")
+        
+        contents = read_when(log_file, "Moved: 'b.pdf'")
+        assert "Moved: 'a.pdf'" in contents
+        assert "Moved: 'b.pdf'" in contents
+    
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX signals only")
+    def test_buffered_records_written_on_sigterm(self, temp_dir):
+        """Test that buffered records survive the CLI being terminated."""
+        log_file = temp_dir / "organizer.log"
+        script = (
+            "import os, signal, sys, time\n"
+            "from pathlib import Path\n"
+            "from file_organizer.cli import _exit_on_signal\n"
+            "from file_organizer.logger import setup_logger\n"
+            "logger = setup_logger(log_file=Path(sys.argv[1]), buffered=True)\n"
+            "signal.signal(signal.SIGTERM, _exit_on_signal)\n"
+            "for i in range(50):\n"
+            "    logger.info('record %d', i)\n"
+            "os.kill(os.getpid(), signal.SIGTERM)\n"
+            "time.sleep(10)\n"
+        )
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+            [os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")]
+            + ([env["PYTHONPATH"]] if env.get("PYTHONPATH") else [])
+        )
+        
+        result = subprocess.run(
+            [sys.executable, "-c", script, str(log_file)], env=env, timeout=30
+        )
+        
+        assert result.returncode == 128 + 15
+        assert "record 49" in log_file.read_text(encoding="utf-8")
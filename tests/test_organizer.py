@@ -1,10 +1,14 @@
 """Unit tests for FileOrganizer."""
+import os
+import time
 import pytest
 import logging
+import threading
+from datetime import datetime
 from pathlib import Path
 from file_organizer.categorizer import FileCategorizer
 from file_organizer.file_mover import FileMover
-from file_organizer.organizer import FileOrganizer
+from file_organizer.organizer import FileOrganizer, is_path_inside
 
 
 class TestFileOrganizer:
@@ -117,3 +121,284 @@ class TestFileOrganizer:
         result = organizer.organize_file(missing_file)
         
         assert result is False
+    
+    def test_organize_all_skips_hidden_temp_and_symlinks(self, temp_dir):
+        """Test that organize_all leaves hidden, temporary and symlinked files in place."""
+        logger = logging.getLogger("test")
+        categorizer = FileCategorizer()
+        mover = FileMover(logger)
+        organizer = FileOrganizer(temp_dir, categorizer, mover, logger)
+        
+        # Create files that should be skipped
+        hidden_file = temp_dir / ".hidden.txt"
+        temp_file = temp_dir / "file.tmp"
+        hidden_file.write_text("hidden")
+        temp_file.write_text("temp")
+        target = temp_dir / "Documents"
+        target.mkdir()
+        (target / "real.pdf").write_text("real")
+        link = temp_dir / "link.pdf"
+        link.symlink_to(target / "real.pdf")
+        
+        # Create one file that should be organized
+        (temp_dir / "report.pdf").write_text("report")
+        
+        count = organizer.organize_all()
+        
+        assert count == 1
+        assert hidden_file.exists()
+        assert temp_file.exists()
+        assert link.is_symlink()
+        assert not (temp_dir / "report.pdf").exists()
+    
+    def test_organize_all_concurrent(self, temp_dir):
+        """Test organizing with multiple worker threads."""
+        logger = logging.getLogger("test")
+        categorizer = FileCategorizer()
+        mover = FileMover(logger)
+        organizer = FileOrganizer(temp_dir, categorizer, mover, logger, max_workers=4)
+        
+        # Spread files over 2 categories x 4 months, i.e. 8 destination folders
+        for i in range(24):
+            file_path = temp_dir / f"file{i}.{'pdf' if i % 2 else 'jpg'}"
+            file_path.write_text(f"content {i}")
+            timestamp = datetime(2025, 1 + (i // 2) % 4 * 3, 15).timestamp()
+            os.utime(file_path, (timestamp, timestamp))
+        
+        # Track how many folder batches run at the same time
+        original_batch = organizer._organize_batch
+        lock = threading.Lock()
+        active = [0]
+        max_active = [0]
+        
+        def tracked_batch(batch):
+            with lock:
+                active[0] += 1
+                max_active[0] = max(max_active[0], active[0])
+            time.sleep(0.05)
+            try:
+                return original_batch(batch)
+            finally:
+                with lock:
+                    active[0] -= 1
+        
+        organizer._organize_batch = tracked_batch
+        
+        count = organizer.organize_all()
+        
+        assert count == 24
+        assert len(list((temp_dir / "Documents").rglob("*.pdf"))) == 12
+        assert len(list((temp_dir / "Pictures").rglob("*.jpg"))) == 12
+        assert len(list((temp_dir / "Documents" / "2025").iterdir())) == 4
+        assert max_active[0] > 1
+    
+    def test_skip_partial_downloads(self, temp_dir):
+        """Test that in-progress browser downloads are skipped."""
+        logger = logging.getLogger("test")
+        categorizer = FileCategorizer()
+        mover = FileMover(logger)
+        organizer = FileOrganizer(temp_dir, categorizer, mover, logger)
+        
+        chrome_download = temp_dir / "movie.mp4.crdownload"
+        firefox_download = temp_dir / "movie.mp4.part"
+        chrome_download.write_text("partial")
+        firefox_download.write_text("partial")
+        
+        assert organizer.organize_file(chrome_download) is False
+        assert organizer.organize_file(firefox_download) is False
+        assert organizer.organize_all() == 0
+        
+        assert chrome_download.exists()
+        assert firefox_download.exists()
+    
+    def test_locked_file_is_retried_in_background(self, temp_dir, monkeypatch):
+        """Test that a locked file is queued for a retry instead of blocking."""
+        logger = logging.getLogger("test")
+        categorizer = FileCategorizer()
+        mover = FileMover(logger)
+        organizer = FileOrganizer(temp_dir, categorizer, mover, logger)
+        monkeypatch.setattr(FileOrganizer, "RETRY_BASE_DELAY", 0.01)
+        
+        original_move = mover.move_file_str
+        calls = []
+        
+        def locked_once(*args):
+            calls.append(args[0])
+            if len(calls) == 1:
+                raise PermissionError("file is locked")
+            return original_move(*args)
+        
+        monkeypatch.setattr(mover, "move_file_str", locked_once)
+        
+        (temp_dir / "locked.pdf").write_text("locked")
+        (temp_dir / "free.jpg").write_text("free")
+        
+        count = organizer.organize_all()
+        
+        assert count == 2
+        assert len(calls) == 3
+        assert not (temp_dir / "locked.pdf").exists()
+        assert not (temp_dir / "free.jpg").exists()
+    
+    def test_busy_file_is_retried(self, temp_dir, monkeypatch):
+        """Test that EBUSY errors are retried like permission errors."""
+        import errno
+        
+        logger = logging.getLogger("test")
+        categorizer = FileCategorizer()
+        mover = FileMover(logger)
+        organizer = FileOrganizer(temp_dir, categorizer, mover, logger)
+        monkeypatch.setattr(FileOrganizer, "RETRY_BASE_DELAY", 0.01)
+        
+        original_move = mover.move_file_str
+        calls = []
+        
+        def busy_once(*args):
+            calls.append(args[0])
+            if len(calls) == 1:
+                raise OSError(errno.EBUSY, "Device or resource busy")
+            return original_move(*args)
+        
+        monkeypatch.setattr(mover, "move_file_str", busy_once)
+        
+        busy = temp_dir / "busy.pdf"
+        busy.write_text("busy")
+        
+        assert organizer.organize_file(busy) is None
+        assert organizer.wait_for_retries() == 1
+        assert len(calls) == 2
+        assert not busy.exists()
+    
+    def test_organize_all_resolves_duplicates_in_destination(self, temp_dir, sample_date):
+        """Test that organize_all renames files colliding with already organized ones."""
+        import os
+        
+        logger = logging.getLogger("test")
+        categorizer = FileCategorizer()
+        mover = FileMover(logger)
+        organizer = FileOrganizer(temp_dir, categorizer, mover, logger)
+        
+        dest_folder = temp_dir / "Documents" / "2025" / "Dec"
+        dest_folder.mkdir(parents=True)
+        (dest_folder / "report.pdf").write_text("old")
+        
+        for name in ("report.pdf", "notes.txt"):
+            file_path = temp_dir / name
+            file_path.write_text("new")
+            os.utime(file_path, (sample_date.timestamp(), sample_date.timestamp()))
+        
+        assert organizer.organize_all() == 2
+        assert (dest_folder / "report.pdf").read_text() == "old"
+        assert (dest_folder / "report(1).pdf").read_text() == "new"
+        assert (dest_folder / "notes.txt").exists()
+    
+    def test_file_removed_before_move(self, temp_dir, caplog):
+        """Test that a file disappearing between listing and moving is reported, not an error."""
+        logger = logging.getLogger("test")
+        categorizer = FileCategorizer()
+        mover = FileMover(logger)
+        organizer = FileOrganizer(temp_dir, categorizer, mover, logger)
+        
+        test_file = temp_dir / "gone.pdf"
+        test_file.write_text("soon gone")
+        stat_result = test_file.lstat()
+        test_file.unlink()
+        
+        with caplog.at_level(logging.WARNING, logger="test"):
+            result = organizer.organize_file(test_file, stat_result=stat_result)
+        
+        assert result is False
+        assert "File no longer exists" in caplog.text
+        assert not any(record.levelno >= logging.ERROR for record in caplog.records)
+    
+    def test_is_path_inside(self, temp_dir):
+        """Test containment checks, including sibling paths sharing a prefix."""
+        child = temp_dir / "Documents" / "2025"
+        sibling = temp_dir.parent / (temp_dir.name + "-other")
+        
+        assert is_path_inside(child, temp_dir) is True
+        assert is_path_inside(temp_dir, temp_dir) is True
+        assert is_path_inside(sibling, temp_dir) is False
+        assert is_path_inside(temp_dir, child) is False
+    
+    def test_is_path_inside_relative_after_chdir(self, temp_dir, monkeypatch):
+        """Test that relative paths are resolved against the current directory."""
+        for tree in ("first", "second"):
+            (temp_dir / tree / "x" / "y").mkdir(parents=True)
+        
+        monkeypatch.chdir(temp_dir / "first")
+        assert is_path_inside(Path("x/y"), Path("x")) is True
+        
+        monkeypatch.chdir(temp_dir / "second")
+        assert is_path_inside(Path("x/y"), Path("x")) is True
+    
+    def test_organize_all_skips_file_with_bad_mtime(self, temp_dir, monkeypatch):
+        """Test that a file whose date can't be converted doesn't abort the run."""
+        import file_organizer.file_mover as file_mover_module
+        
+        logger = logging.getLogger("test")
+        organizer = FileOrganizer(temp_dir, FileCategorizer(), FileMover(logger), logger)
+        
+        bad = temp_dir / "old.pdf"
+        good = temp_dir / "ok.pdf"
+        bad.write_text("old")
+        good.write_text("ok")
+        os.utime(bad, (-86400, -86400))
+        
+        file_mover_module._ts_to_ym.cache_clear()
+        real_localtime = time.localtime
+        
+        def windows_localtime(seconds=None):
+            # Windows rejects timestamps before 1970
+            if seconds is not None and seconds < 0:
+                raise OSError(22, "Invalid argument")
+            return real_localtime(seconds)
+        
+        monkeypatch.setattr(file_mover_module.time, "localtime", windows_localtime)
+        try:
+            count = organizer.organize_all()
+        finally:
+            file_mover_module._ts_to_ym.cache_clear()
+        
+        assert count == 1
+        assert bad.exists()
+        assert not good.exists()
+    
+    def test_organize_all_recreates_deleted_destination(self, temp_dir, sample_date):
+        """Test that a second run recreates a destination folder deleted in between."""
+        import shutil
+        
+        logger = logging.getLogger("test")
+        organizer = FileOrganizer(temp_dir, FileCategorizer(), FileMover(logger), logger)
+        timestamp = sample_date.timestamp()
+        
+        first = temp_dir / "a.pdf"
+        first.write_text("a")
+        os.utime(first, (timestamp, timestamp))
+        assert organizer.organize_all() == 1
+        
+        shutil.rmtree(temp_dir / "Documents")
+        second = temp_dir / "b.pdf"
+        second.write_text("b")
+        os.utime(second, (timestamp, timestamp))
+        
+        assert organizer.organize_all() == 1
+        assert not second.exists()
+        assert (temp_dir / "Documents" / "2025" / "Dec" / "b.pdf").exists()
+    
+    def test_organize_batch_continues_when_prepare_fails(self, temp_dir, monkeypatch):
+        """Test that a failed folder preparation doesn't drop the whole batch."""
+        logger = logging.getLogger("test")
+        mover = FileMover(logger)
+        organizer = FileOrganizer(temp_dir, FileCategorizer(), mover, logger)
+        
+        def failing_prepare(*args):
+            raise OSError("listing failed")
+        
+        monkeypatch.setattr(mover, "prepare_destination", failing_prepare)
+        (temp_dir / "a.pdf").write_text("a")
+        (temp_dir / "b.pdf").write_text("b")
+        
+        assert organizer.organize_all() == 2
+        assert not (temp_dir / "a.pdf").exists()
+        assert not (temp_dir / "b.pdf").exists()
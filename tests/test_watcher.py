@@ -0,0 +1,266 @@
+"""Unit tests for the file watcher."""
+import io
+import os
+import sys
+import time
+import shutil
+import logging
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+from watchdog.events import FileCreatedEvent, FileModifiedEvent, FileMovedEvent
+from watchdog.observers import Observer
+
+from file_organizer import watcher as watcher_module
+from file_organizer.categorizer import FileCategorizer
+from file_organizer.file_mover import FileMover
+from file_organizer.organizer import FileOrganizer
+from file_organizer.watcher import FileEventHandler, FileWatcher, is_remote_filesystem
+
+
+def wait_for(condition, timeout=5.0):
+    """Poll a condition until it holds or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return condition()
+
+
+class RecordingOrganizer:
+    """Stand-in organizer that records the files it is asked to organize."""
+    
+    max_workers = 1
+    
+    def __init__(self):
+        self.calls = []
+    
+    def organize_file(self, file_path):
+        self.calls.append(file_path)
+        return True
+
+
+@pytest.fixture
+def handler():
+    """Create an event handler with a short debounce delay."""
+    organizer = RecordingOrganizer()
+    event_handler = FileEventHandler(organizer, logging.getLogger("test"), debounce_seconds=0.2)
+    yield event_handler
+    event_handler.close()
+
+
+@pytest.fixture(params=["watchdog", "inotify"])
+def running_watcher(request, temp_dir, monkeypatch):
+    """Start a FileWatcher on temp_dir with each observer backend."""
+    if request.param == "inotify":
+        if not sys.platform.startswith("linux") or watcher_module.inotify_simple is None:
+            pytest.skip("inotify_simple is not available")
+    else:
+        monkeypatch.setattr(watcher_module, "inotify_simple", None)
+    
+    logger = logging.getLogger("test")
+    organizer = FileOrganizer(temp_dir, FileCategorizer(), FileMover(logger), logger)
+    file_watcher = FileWatcher(temp_dir, organizer, logger, debounce_seconds=0.05)
+    
+    thread = threading.Thread(target=file_watcher.start, daemon=True)
+    thread.start()
+    # Give the observer time to install its watch
+    time.sleep(0.3)
+    yield file_watcher
+    file_watcher.stop()
+    thread.join(timeout=5)
+
+
+class TestFileWatcher:
+    """Test suite for FileWatcher class."""
+    
+    def test_file_moved_in_is_organized(self, running_watcher, temp_dir):
+        """Test that a file moved in from another directory is organized."""
+        outside = Path(tempfile.mkdtemp())
+        try:
+            source = outside / "photo.jpg"
+            source.write_text("image")
+            
+            shutil.move(str(source), str(temp_dir / "photo.jpg"))
+            
+            assert wait_for(lambda: not (temp_dir / "photo.jpg").exists())
+            assert len(list((temp_dir / "Pictures").rglob("photo.jpg"))) == 1
+        finally:
+            shutil.rmtree(outside)
+    
+    def test_finished_download_is_organized(self, running_watcher, temp_dir):
+        """Test that a partial download renamed to its final name is organized."""
+        partial = temp_dir / "report.pdf.crdownload"
+        partial.write_text("downloading")
+        time.sleep(0.2)
+        
+        partial.rename(temp_dir / "report.pdf")
+        
+        assert wait_for(lambda: not (temp_dir / "report.pdf").exists())
+        assert len(list((temp_dir / "Documents").rglob("report.pdf"))) == 1
+    
+    def test_falls_back_to_watchdog_when_inotify_fails(self, temp_dir, monkeypatch):
+        """Test that an inotify setup error selects watchdog's observer."""
+        class BrokenINotify:
+            def __init__(self):
+                raise OSError(24, "Too many open files")
+        
+        class FakeInotifySimple:
+            INotify = BrokenINotify
+        
+        if not sys.platform.startswith("linux"):
+            pytest.skip("inotify is Linux-only")
+        monkeypatch.setattr(watcher_module, "inotify_simple", FakeInotifySimple)
+        
+        logger = logging.getLogger("test")
+        organizer = FileOrganizer(temp_dir, FileCategorizer(), FileMover(logger), logger)
+        file_watcher = FileWatcher(temp_dir, organizer, logger)
+        try:
+            assert isinstance(file_watcher.observer, Observer)
+        finally:
+            file_watcher.event_handler.close()
+
+
+class TestFileEventHandler:
+    """Test suite for FileEventHandler debouncing."""
+    
+    def test_created_file_processed_after_delay(self, handler, temp_dir):
+        """Test that a new file is processed once, after the debounce delay."""
+        path = str(temp_dir / "report.pdf")
+        
+        handler.dispatch(FileCreatedEvent(path))
+        
+        assert handler.organizer.calls == []
+        assert wait_for(lambda: handler.organizer.calls)
+        assert handler.organizer.calls == [Path(path)]
+    
+    def test_modify_pushes_back_pending_file(self, handler, temp_dir):
+        """Test that writes to a pending file delay it, leaving stale deadlines behind."""
+        path = str(temp_dir / "report.pdf")
+        
+        handler.dispatch(FileCreatedEvent(path))
+        for _ in range(3):
+            time.sleep(0.1)
+            handler.dispatch(FileModifiedEvent(path))
+        
+        # The original deadline has passed, but the file is still being written
+        assert handler.organizer.calls == []
+        assert wait_for(lambda: handler.organizer.calls)
+        time.sleep(0.3)
+        # The superseded heap entries didn't trigger extra processing
+        assert handler.organizer.calls == [Path(path)]
+    
+    def test_modify_of_untracked_file_ignored(self, handler, temp_dir):
+        """Test that modify events alone don't queue a file."""
+        handler.dispatch(FileModifiedEvent(str(temp_dir / "report.pdf")))
+        
+        time.sleep(0.4)
+        
+        assert handler.organizer.calls == []
+    
+    def test_ignored_names_not_queued(self, handler, temp_dir):
+        """Test that hidden and partial files are filtered before queueing."""
+        handler.dispatch(FileCreatedEvent(str(temp_dir / ".hidden.pdf")))
+        handler.dispatch(FileCreatedEvent(str(temp_dir / "movie.mp4.part")))
+        
+        time.sleep(0.4)
+        
+        assert handler.organizer.calls == []
+    
+    def test_moved_file_queued_under_new_name(self, handler, temp_dir):
+        """Test that a pending file renamed before processing is queued by its new name."""
+        old_path = str(temp_dir / "draft.pdf")
+        new_path = str(temp_dir / "final.pdf")
+        
+        handler.dispatch(FileCreatedEvent(old_path))
+        handler.dispatch(FileMovedEvent(old_path, new_path))
+        
+        assert wait_for(lambda: handler.organizer.calls)
+        time.sleep(0.3)
+        assert handler.organizer.calls == [Path(new_path)]
+    
+    def test_close_drops_pending_files(self, handler, temp_dir):
+        """Test that close() stops the debounce thread without processing pending files."""
+        handler.dispatch(FileCreatedEvent(str(temp_dir / "report.pdf")))
+        
+        handler.close()
+        time.sleep(0.3)
+        
+        assert not handler._debounce_thread.is_alive()
+        assert handler.organizer.calls == []
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="/proc/mounts is Linux-only")
+class TestIsRemoteFilesystem:
+    """Test suite for the /proc/mounts parsing in is_remote_filesystem."""
+    
+    @pytest.fixture
+    def mounts(self, monkeypatch):
+        """Replace /proc/mounts with given lines."""
+        def set_mounts(*lines):
+            contents = "\n".join(lines) + "\n"
+            
+            def fake_open(path, *args, **kwargs):
+                assert path == "/proc/mounts"
+                return io.StringIO(contents)
+            
+            monkeypatch.setattr(watcher_module, "open", fake_open, raising=False)
+        
+        # Keep the made-up paths as written, even if /srv or /mnt is a symlink here
+        monkeypatch.setattr(watcher_module.os.path, "realpath", lambda path: os.fspath(path))
+        return set_mounts
+    
+    def test_longest_mount_point_wins(self, mounts):
+        """Test that the most specific mount point decides the filesystem type."""
+        mounts(
+            "/dev/sda1 / ext4 rw 0 0",
+            "server:/export /srv/share nfs4 rw 0 0",
+            "/dev/sdb1 /srv/share/local ext4 rw 0 0",
+        )
+        
+        assert is_remote_filesystem(Path("/srv/share/docs")) is True
+        assert is_remote_filesystem(Path("/srv/share")) is True
+        assert is_remote_filesystem(Path("/srv/share/local/docs")) is False
+        assert is_remote_filesystem(Path("/srv/shared")) is False
+    
+    def test_later_overmount_wins(self, mounts):
+        """Test that a later mount on the same mount point hides the earlier one."""
+        mounts(
+            "/dev/sda1 / ext4 rw 0 0",
+            "/dev/sdb1 /data ext4 rw 0 0",
+            "//server/share /data cifs rw 0 0",
+        )
+        assert is_remote_filesystem(Path("/data/Downloads")) is True
+        
+        mounts(
+            "/dev/sda1 / ext4 rw 0 0",
+            "//server/share /data cifs rw 0 0",
+            "/dev/sdb1 /data ext4 rw 0 0",
+        )
+        assert is_remote_filesystem(Path("/data/Downloads")) is False
+    
+    def test_escaped_mount_points(self, mounts):
+        """Test that octal escapes in mount points are decoded."""
+        mounts(
+            "/dev/sda1 / ext4 rw 0 0",
+            "server:/a /mnt/my\\040share nfs rw 0 0",
+            "server:/b /mnt/tab\\011dir nfs rw 0 0",
+            "server:/c /mnt/back\\134slash cifs rw 0 0",
+        )
+        
+        assert is_remote_filesystem(Path("/mnt/my share/file")) is True
+        assert is_remote_filesystem(Path("/mnt/tab\tdir/file")) is True
+        assert is_remote_filesystem(Path("/mnt/back\\slash/file")) is True
+        assert is_remote_filesystem(Path("/mnt/other/file")) is False
+    
+    def test_unreadable_mounts_means_local(self, monkeypatch):
+        """Test that a missing /proc/mounts is treated as a local filesystem."""
+        def failing_open(path, *args, **kwargs):
+            raise FileNotFoundError(path)
+        
+        monkeypatch.setattr(watcher_module, "open", failing_open, raising=False)
+        
+        assert is_remote_filesystem(Path("/srv/share")) is False